@@ -1,27 +1,6 @@
 import sys
-from typing import Optional
 
-from syllabifier import cmuparser3
-from syllabifier.syllable3 import generate_syllables
-
-cmu_dict = cmuparser3.CMUDictionary()
-
-
-def generate(candidate: str) -> Optional[map]:
-    phoneme_str = cmu_dict.get_first(candidate)
-    if phoneme_str:
-        return generate_syllables(phoneme_str)
-    else:
-        print("***" + candidate + " not in CMU dictionary, sorry, please try again...")
-        return None
-
-
-def num_syllables(candidate: str) -> Optional[int]:
-    # print(f"{candidate}")
-    syl_map = generate(candidate)
-    if syl_map is not None:
-        return len(syl_map)
-    return None
+from syllabifier.syllable3 import generate, num_syllables
 
 
 if __name__ == "__main__":
@@ -0,0 +1,34 @@
+"""
+Compares the full syllabification engine against the counting fast path over the whole
+CMU dictionary.
+
+    python3 -m syllabifier.bench_syllables
+"""
+
+import time
+
+from .syllable3 import cmu_dict, count_syllables, generate_syllables
+
+
+def pronunciations():
+    return [ph for _, phoneme_strs in cmu_dict.items() for ph in phoneme_strs]
+
+
+def time_engine(engine, phoneme_strs) -> float:
+    start = time.perf_counter()
+    for phoneme_str in phoneme_strs:
+        try:
+            engine(phoneme_str)
+        except (AttributeError, IndexError, ValueError):
+            pass
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    phoneme_strs = pronunciations()
+    full = time_engine(generate_syllables, phoneme_strs)
+    fast = time_engine(count_syllables, phoneme_strs)
+    print(f"{len(phoneme_strs)} pronunciations")
+    print(f"len(generate_syllables): {full:.3f}s")
+    print(f"count_syllables:         {fast:.3f}s")
+    print(f"speedup:                 {full / fast:.1f}x")
@@ -1,10 +1,16 @@
+import codecs
+import hashlib
 import os
+import pickle
 import re
+import tempfile
 from collections import defaultdict
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Tuple
 
+# the word and its phonemes are separated by two spaces; `\s` would also match characters
+# like U+0085 that appear inside Latin-1 decoded entries
 CMU_PATTERN = re.compile(
-    r"(?P<Word>'?\w+[^()]*)(?P<Alt>\(\d+\))?\s\s(?P<Phoneme>[^\n]+)"
+    r"(?P<Word>'?\w+[^()]*)(?P<Alt>\(\d+\))?[ \t][ \t](?P<Phoneme>[^\n]+)"
 )
 
 CMU_DIR = "CMU_dictionary"
@@ -12,19 +18,152 @@ VERSION = "cmudict.0.7a"
 FOLDER_ROOT = os.path.dirname(os.path.abspath(__file__))
 DICT_PATH = os.path.join(FOLDER_ROOT, CMU_DIR, VERSION)
 
+DEFAULT_ENCODING = "latin-1"
+# compiled dictionary caches, kept out of the dictionary folders so that a writable folder
+# can't be used to plant a pickle
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "syllabifier",
+)
+# part of every compiled cache key: bump whenever CMU_PATTERN or parse_dictionary changes
+CACHE_VERSION = 2
+# dictionary versions that can be loaded, mapping each version to the path of its file and
+# the encoding used to decode its bytes
+VERSIONS: Dict[str, Tuple[str, str]] = {
+    VERSION: (DICT_PATH, "ascii"),
+    "cmudict-0.7b": (os.path.join(FOLDER_ROOT, CMU_DIR, "cmudict-0.7b"), DEFAULT_ENCODING),
+}
+
+# pronunciation strings shared by every loaded version, so identical pronunciations in
+# two lexicons are stored once
+PHONEME_TABLE: Dict[str, str] = {}
+
+# parsed dictionaries, by version, shared by every CMUDictionary of that version
+_loaded: Dict[str, Dict[str, List[str]]] = {}
+
+
+def register_version(
+    version: str, encoding: str = DEFAULT_ENCODING, path: Optional[str] = None
+) -> None:
+    """
+    Makes `version` loadable, decoding its file as `encoding`. The file is `version` in
+    `CMU_DIR` unless `path` is given.
+    """
+    codecs.lookup(encoding)
+    VERSIONS[version] = (path or os.path.join(FOLDER_ROOT, CMU_DIR, version), encoding)
+    unload_version(version)
+
+
+def unload_version(version: str) -> None:
+    """
+    Drops the parsed copy of `version`, and any pronunciations only it used from
+    `PHONEME_TABLE`. Existing CMUDictionary objects for it keep working.
+    """
+    if _loaded.pop(version, None) is None:
+        return
+    PHONEME_TABLE.clear()
+    for cmudict in _loaded.values():
+        for phoneme_strs in cmudict.values():
+            for phonemes in phoneme_strs:
+                PHONEME_TABLE[phonemes] = phonemes
+
+
+def intern_phonemes(phonemes: str) -> str:
+    return PHONEME_TABLE.setdefault(phonemes, phonemes)
+
+
+def parse_dictionary(path: str, encoding: str) -> Dict[str, List[str]]:
+    cmudict: Dict[str, List[str]] = defaultdict(list)
+    with open(path, "rb") as dict_file:
+        text = dict_file.read().decode(encoding)
+    # only \n, \r\n and \r end a line, as when reading in text mode; str.splitlines would
+    # also split on characters like U+0085 that Latin-1 decodes from ordinary bytes
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    for line in text.split("\n"):
+        match = CMU_PATTERN.match(line)
+        if not match or not match.group("Word"):
+            continue
+        cmudict[match.group("Word")].append(intern_phonemes(match.group("Phoneme")))
+    return cmudict
+
+
+def cache_path(path: str) -> str:
+    """compiled cache file for the dictionary at `path`, named after its absolute path"""
+    digest = hashlib.sha256(os.path.abspath(path).encode("utf-8", "surrogateescape"))
+    return os.path.join(CACHE_DIR, f"{os.path.basename(path)}-{digest.hexdigest()[:16]}.pickle")
+
+
+def is_trusted(cache_file) -> bool:
+    """
+    Unpickling runs arbitrary code, so only caches that this user wrote, and that nobody else
+    can overwrite, are loaded
+    """
+    stat = os.fstat(cache_file.fileno())
+    if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+        return False
+    return not stat.st_mode & 0o022
+
+
+def load_dictionary(version: str) -> Dict[str, List[str]]:
+    """
+    Parses `version`, going through a compiled cache in `CACHE_DIR` which is rebuilt whenever
+    the file, its encoding, or `CACHE_VERSION` changes
+    """
+    path, encoding = VERSIONS[version]
+    stat = os.stat(path)
+    key = (CACHE_VERSION, stat.st_mtime_ns, stat.st_size, encoding)
+
+    try:
+        with open(cache_path(path), "rb") as cache_file:
+            if is_trusted(cache_file):
+                cached_key, cmudict = pickle.load(cache_file)
+                if cached_key == key:
+                    for phoneme_strs in cmudict.values():
+                        phoneme_strs[:] = [intern_phonemes(ph) for ph in phoneme_strs]
+                    return cmudict
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+
+    cmudict = parse_dictionary(path, encoding)
+    write_cache(cache_path(path), (key, cmudict))
+    return cmudict
+
+
+def write_cache(path: str, contents) -> None:
+    """
+    Pickles `contents` to a temporary file and moves it into place, so a process starting at
+    the same time never reads a half-written cache. Caching is best effort.
+    """
+    try:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as cache_file:
+            pickle.dump(contents, cache_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
 
 class CMUDictionary:
-    def __init__(self):
-        if not os.path.exists(DICT_PATH):
-            raise IOError(f"Could not read in {DICT_PATH}")
-
-        self._cmudict: Dict[str, List] = defaultdict(list)
-        with open(DICT_PATH) as dict_file:
-            for line in dict_file.readlines():
-                match = re.match(CMU_PATTERN, line)
-                if not match or not match.group("Word"):
-                    continue
-                self._cmudict[match.group("Word")].append(match.group("Phoneme"))
+    def __init__(self, version: str = VERSION):
+        if version not in VERSIONS:
+            raise ValueError(
+                f"Unknown dictionary version {version}, register it with register_version()"
+            )
+        path, _ = VERSIONS[version]
+        if not os.path.exists(path):
+            raise IOError(f"Could not read in {path}")
+
+        self.version = version
+        if version not in _loaded:
+            _loaded[version] = load_dictionary(version)
+        self._cmudict: Dict[str, List] = _loaded[version]
 
     def get(self, key, default=None) -> List[str]:
         return self._cmudict.get(key.upper(), default)
@@ -35,6 +174,9 @@ class CMUDictionary:
             return phonemes[0]
         return phonemes
 
+    def items(self) -> Iterator[Tuple[str, List[str]]]:
+        return iter(self._cmudict.items())
+
     def __getitem__(self, key):
         try:
             return self._cmudict[key.upper()]
@@ -0,0 +1,96 @@
+"""
+Generates `phoneme_features.py` from `CMU_dictionary/arpa_phonemes.csv`, so that phoneme
+classification needs no CSV read at import time. Re-run after editing the CSV:
+
+    python3 -m syllabifier.gen_phoneme_features
+"""
+
+import csv
+import os
+
+PHONEME_FILE_NAME = "arpa_phonemes.csv"
+FOLDER_ROOT = os.path.dirname(os.path.abspath(__file__))
+DICT_PATH = "CMU_dictionary"
+PHONEME_PATH = os.path.join(FOLDER_ROOT, DICT_PATH, PHONEME_FILE_NAME)
+OUTPUT_PATH = os.path.join(FOLDER_ROOT, "phoneme_features.py")
+
+HEADER = '''"""
+Precomputed feature record for every ARPAbet phoneme.
+
+Generated from CMU_dictionary/{csv_name} by `python3 -m syllabifier.gen_phoneme_features`,
+do not edit by hand.
+"""
+
+from typing import Dict, NamedTuple
+
+
+class PhonemeFeatures(NamedTuple):
+    phoneme_class: str
+    is_vowel: bool
+    is_voiced: bool
+    is_plosive: bool
+    is_fricative: bool
+    is_affricate: bool
+    is_obstruent: bool
+    is_voiced_obstruent: bool
+    is_approximant: bool
+    is_liquid: bool
+    is_glide: bool
+
+
+FEATURES: Dict[str, PhonemeFeatures] = {{
+'''
+
+
+def read_arpa():
+    arpa = {}
+    with open(PHONEME_PATH, "r") as ph_file:
+        header = ph_file.readline().strip().split(",")
+        reader = csv.DictReader(ph_file, header)
+        for row in reader:
+            arpa[row["PHONEME"]] = {key: value.strip().upper() for key, value in row.items()}
+    return arpa
+
+
+def features(data) -> dict:
+    airstream = data["AIRSTREAM MECHANISM"]
+    plosive = "PLOSIVE" in airstream
+    fricative = "FRICATIVE" in airstream
+    voiced = "VOICED" in data["VOICE"]
+    approximant = "APPROXIMANT" in airstream
+    liquid = "LIQUID" in data["CLASS"]
+    return dict(
+        phoneme_class=data["CLASS"],
+        is_vowel=data["CLASS"] == "VOWEL",
+        is_voiced=voiced,
+        is_plosive=plosive,
+        is_fricative=fricative,
+        is_affricate="AFFRICATE" in airstream,
+        is_obstruent=plosive or fricative,
+        is_voiced_obstruent=voiced and (plosive or fricative),
+        is_approximant=approximant,
+        is_liquid=liquid,
+        is_glide=approximant and not liquid,
+    )
+
+
+def literal(value) -> str:
+    if isinstance(value, str):
+        return f'"{value}"'
+    return repr(value)
+
+
+def generate() -> str:
+    lines = [HEADER.format(csv_name=PHONEME_FILE_NAME)]
+    for phoneme, data in read_arpa().items():
+        lines.append(f"    {literal(phoneme)}: PhonemeFeatures(\n")
+        lines.extend(f"        {key}={literal(value)},\n" for key, value in features(data).items())
+        lines.append("    ),\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+
+if __name__ == "__main__":
+    with open(OUTPUT_PATH, "w") as out_file:
+        out_file.write(generate())
+    print(f"Wrote {OUTPUT_PATH}")
@@ -0,0 +1,533 @@
+"""
+Precomputed feature record for every ARPAbet phoneme.
+
+Generated from CMU_dictionary/arpa_phonemes.csv by `python3 -m syllabifier.gen_phoneme_features`,
+do not edit by hand.
+"""
+
+from typing import Dict, NamedTuple
+
+
+class PhonemeFeatures(NamedTuple):
+    phoneme_class: str
+    is_vowel: bool
+    is_voiced: bool
+    is_plosive: bool
+    is_fricative: bool
+    is_affricate: bool
+    is_obstruent: bool
+    is_voiced_obstruent: bool
+    is_approximant: bool
+    is_liquid: bool
+    is_glide: bool
+
+
+FEATURES: Dict[str, PhonemeFeatures] = {
+    "AA": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "AE": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "AH": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "AO": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "AW": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "AY": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "B": PhonemeFeatures(
+        phoneme_class="STOP",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=True,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=True,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "CH": PhonemeFeatures(
+        phoneme_class="AFFRICATE",
+        is_vowel=False,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=True,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "D": PhonemeFeatures(
+        phoneme_class="STOP",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=True,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=True,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "DH": PhonemeFeatures(
+        phoneme_class="FRICATIVE",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=False,
+        is_fricative=True,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=True,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "EH": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "ER": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "EY": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "F": PhonemeFeatures(
+        phoneme_class="FRICATIVE",
+        is_vowel=False,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=True,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "G": PhonemeFeatures(
+        phoneme_class="STOP",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=True,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=True,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "HH": PhonemeFeatures(
+        phoneme_class="ASPIRATE",
+        is_vowel=False,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=True,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "IH": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "IY": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "JH": PhonemeFeatures(
+        phoneme_class="AFFRICATE",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=True,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "K": PhonemeFeatures(
+        phoneme_class="STOP",
+        is_vowel=False,
+        is_voiced=False,
+        is_plosive=True,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "L": PhonemeFeatures(
+        phoneme_class="LIQUID",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=True,
+        is_liquid=True,
+        is_glide=False,
+    ),
+    "M": PhonemeFeatures(
+        phoneme_class="NASAL",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "N": PhonemeFeatures(
+        phoneme_class="NASAL",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "NG": PhonemeFeatures(
+        phoneme_class="NASAL",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "OW": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "OY": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "P": PhonemeFeatures(
+        phoneme_class="STOP",
+        is_vowel=False,
+        is_voiced=False,
+        is_plosive=True,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "R": PhonemeFeatures(
+        phoneme_class="LIQUID",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=True,
+        is_liquid=True,
+        is_glide=False,
+    ),
+    "S": PhonemeFeatures(
+        phoneme_class="FRICATIVE",
+        is_vowel=False,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=True,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "SH": PhonemeFeatures(
+        phoneme_class="FRICATIVE",
+        is_vowel=False,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=True,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "T": PhonemeFeatures(
+        phoneme_class="STOP",
+        is_vowel=False,
+        is_voiced=False,
+        is_plosive=True,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "TH": PhonemeFeatures(
+        phoneme_class="FRICATIVE",
+        is_vowel=False,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=True,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "UH": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "UW": PhonemeFeatures(
+        phoneme_class="VOWEL",
+        is_vowel=True,
+        is_voiced=False,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "V": PhonemeFeatures(
+        phoneme_class="FRICATIVE",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=False,
+        is_fricative=True,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=True,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "W": PhonemeFeatures(
+        phoneme_class="SEMIVOWEL",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=True,
+        is_liquid=False,
+        is_glide=True,
+    ),
+    "Y": PhonemeFeatures(
+        phoneme_class="SEMIVOWEL",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=False,
+        is_fricative=False,
+        is_affricate=False,
+        is_obstruent=False,
+        is_voiced_obstruent=False,
+        is_approximant=True,
+        is_liquid=False,
+        is_glide=True,
+    ),
+    "Z": PhonemeFeatures(
+        phoneme_class="FRICATIVE",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=False,
+        is_fricative=True,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=True,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+    "ZH": PhonemeFeatures(
+        phoneme_class="FRICATIVE",
+        is_vowel=False,
+        is_voiced=True,
+        is_plosive=False,
+        is_fricative=True,
+        is_affricate=False,
+        is_obstruent=True,
+        is_voiced_obstruent=True,
+        is_approximant=False,
+        is_liquid=False,
+        is_glide=False,
+    ),
+}
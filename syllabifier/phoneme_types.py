@@ -1,5 +1,4 @@
-import os
-import csv
+from .phoneme_features import FEATURES, PhonemeFeatures
 
 AO = "AO"
 UW = "UW"
@@ -88,31 +87,18 @@ CONSONANTS = [
     Y,
 ]
 
-PHONEME_FILE_NAME = "arpa_phonemes.csv"
-FOLDER_ROOT = os.path.dirname(os.path.abspath(__file__))
-DICT_PATH = "CMU_dictionary"
-PHONEME_PATH = os.path.join(FOLDER_ROOT, DICT_PATH, PHONEME_FILE_NAME)
+def make_set(flag: str):
+    return {ph for ph, features in FEATURES.items() if getattr(features, flag)}
 
-arpa = {}
-with open(PHONEME_PATH, "r") as ph_file:
-    header = ph_file.readline().strip().split(",")
-    reader = csv.DictReader(ph_file, header)
-    for row in reader:
-        arpa[row["PHONEME"]] = row
 
-
-def make_set(key, value):
-    return {ph for ph, data in arpa.items() if value.upper() in data[key.upper()]}
-
-
-AFFRICATES = make_set("airstream mechanism", "affricate")
-PLOSIVES = make_set("airstream mechanism", "plosive")
-FRICATIVES = make_set("airstream mechanism", "fricative")
+AFFRICATES = make_set("is_affricate")
+PLOSIVES = make_set("is_plosive")
+FRICATIVES = make_set("is_fricative")
 
 OBSTRUENTS = PLOSIVES | FRICATIVES
-VOICED = make_set("voice", "voiced")
+VOICED = make_set("is_voiced")
 VOICED_OBSTRUENTS = VOICED & OBSTRUENTS
 
-APPROXIMANTS = make_set("airstream mechanism", "approximant")
-LIQUIDS = make_set("class", "liquid")
+APPROXIMANTS = make_set("is_approximant")
+LIQUIDS = make_set("is_liquid")
 GLIDES = APPROXIMANTS - LIQUIDS
@@ -0,0 +1,215 @@
+"""
+Syllabifies every pronunciation in the CMU dictionary across all cores, reports failures,
+timing outliers and per-rule statistics, and diffs the results against a golden snapshot.
+
+    python3 -m syllabifier.sweep
+    python3 -m syllabifier.sweep --update-golden
+"""
+
+import argparse
+import gzip
+import os
+import statistics
+import sys
+import time
+import timeit
+from collections import Counter
+from multiprocessing import Pool
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from . import syllable3
+
+FOLDER_ROOT = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_PATH = os.path.join(FOLDER_ROOT, "sweep_golden.tsv.gz")
+
+CHUNK_SIZE = 2000
+OUTLIER_FACTOR = 20
+RETIME_REPEATS = 5
+RETIME_NUMBER = 5
+MAX_LISTED = 25
+
+# (word, index of alternate pronunciation, phoneme string)
+Entry = Tuple[str, int, str]
+# (word, index of alternate pronunciation, syllabification or error, seconds taken)
+Result = Tuple[str, int, str, float]
+
+
+def dictionary_entries() -> List[Entry]:
+    return [
+        (word, alt, phoneme_str)
+        for word, phoneme_strs in syllable3.cmu_dict.items()
+        for alt, phoneme_str in enumerate(phoneme_strs)
+    ]
+
+
+def syllabify_entry(phoneme_str: str) -> str:
+    """returns the syllabification of `phoneme_str`, or the error it raised prefixed with '!'"""
+    try:
+        return " ".join(str(syl) for syl in syllable3.generate_syllables(phoneme_str))
+    except Exception as err:
+        return f"!{type(err).__name__}: {err}"
+
+
+def sweep_chunk(chunk: List[Entry]) -> Tuple[List[Result], Counter]:
+    rule_stats_before = Counter(syllable3.rule_stats)
+    results = []
+    for word, alt, phoneme_str in chunk:
+        start = time.perf_counter()
+        outcome = syllabify_entry(phoneme_str)
+        results.append((word, alt, outcome, time.perf_counter() - start))
+    return results, syllable3.rule_stats - rule_stats_before
+
+
+def sweep(entries: List[Entry], workers: int) -> Tuple[List[Result], Counter]:
+    chunks = [entries[i : i + CHUNK_SIZE] for i in range(0, len(entries), CHUNK_SIZE)]
+    if workers == 1:
+        return merge_chunks(map(sweep_chunk, chunks))
+    with Pool(workers) as pool:
+        return merge_chunks(pool.imap(sweep_chunk, chunks))
+
+
+def merge_chunks(
+    chunk_results: Iterable[Tuple[List[Result], Counter]]
+) -> Tuple[List[Result], Counter]:
+    results: List[Result] = []
+    rule_stats: Counter = Counter()
+    for chunk_result, chunk_stats in chunk_results:
+        results.extend(chunk_result)
+        rule_stats.update(chunk_stats)
+    return results, rule_stats
+
+
+def retime(phoneme_str: str) -> float:
+    """best-of-`RETIME_REPEATS` time for one syllabification of `phoneme_str`, in seconds"""
+    timer = timeit.Timer(lambda: syllabify_entry(phoneme_str))
+    return min(timer.repeat(RETIME_REPEATS, RETIME_NUMBER)) / RETIME_NUMBER
+
+
+def find_outliers(
+    entries: List[Entry], results: List[Result]
+) -> Tuple[float, List[Result]]:
+    """
+    Returns the median sweep time, and the entries that are more than `OUTLIER_FACTOR` times
+    slower than it. A single wall-clock sample in a busy process pool is mostly scheduler and
+    GC noise, so every candidate is re-timed in-process and kept only if it is still slow.
+    """
+    if not results:
+        return 0.0, []
+    median = statistics.median(r[3] for r in results)
+    threshold = OUTLIER_FACTOR * median
+    outliers = []
+    for (_, _, phoneme_str), (word, alt, outcome, seconds) in zip(entries, results):
+        if seconds <= threshold:
+            continue
+        seconds = retime(phoneme_str)
+        if seconds > threshold:
+            outliers.append((word, alt, outcome, seconds))
+    outliers.sort(key=lambda r: r[3], reverse=True)
+    return median, outliers
+
+
+def read_golden(path: str) -> Dict[Tuple[str, int], str]:
+    golden = {}
+    with gzip.open(path, "rt", encoding="utf-8") as golden_file:
+        for line in golden_file:
+            word, alt, outcome = line.rstrip("\n").split("\t")
+            golden[(word, int(alt))] = outcome
+    return golden
+
+
+def write_golden(path: str, results: List[Result]) -> None:
+    with gzip.open(path, "wt", encoding="utf-8") as golden_file:
+        for word, alt, outcome, _ in sorted(results):
+            golden_file.write(f"{word}\t{alt}\t{outcome}\n")
+
+
+def diff_golden(
+    golden: Dict[Tuple[str, int], str], results: List[Result]
+) -> List[str]:
+    """returns one line per entry that was added, removed, or changed relative to `golden`"""
+    current = {(word, alt): outcome for word, alt, outcome, _ in results}
+    lines = []
+    for key in sorted(golden.keys() | current.keys()):
+        before, after = golden.get(key), current.get(key)
+        if before == after:
+            continue
+        word, alt = key
+        lines.append(f"{word}({alt}): {before} -> {after}")
+    return lines
+
+
+def build_report(
+    results: List[Result],
+    median: float,
+    outliers: List[Result],
+    rule_stats: Counter,
+    elapsed: float,
+    workers: int,
+    golden_diff: Optional[List[str]],
+) -> str:
+    lines = [f"Swept {len(results)} pronunciations in {elapsed:.2f}s on {workers} worker(s)"]
+
+    failures = [r for r in results if r[2].startswith("!")]
+    lines.append(f"\nFailures: {len(failures)}")
+    lines.extend(f"  {word}({alt}): {outcome[1:]}" for word, alt, outcome, _ in failures)
+
+    lines.append(
+        f"\nTiming outliers (> {OUTLIER_FACTOR}x median of {median * 1e6:.1f}us, "
+        f"best of {RETIME_REPEATS} re-timings): {len(outliers)}"
+    )
+    lines.extend(
+        f"  {word}({alt}): {seconds * 1e6:.1f}us"
+        for word, alt, _, seconds in outliers[:MAX_LISTED]
+    )
+
+    lines.append("\nRule applications:")
+    lines.extend(f"  {rule}: {count}" for rule, count in sorted(rule_stats.items()))
+
+    if golden_diff is None:
+        lines.append("\nGolden snapshot: not compared")
+    else:
+        lines.append(f"\nGolden snapshot differences: {len(golden_diff)}")
+        lines.extend(f"  {line}" for line in golden_diff[:MAX_LISTED])
+        if len(golden_diff) > MAX_LISTED:
+            lines.append(f"  ... and {len(golden_diff) - MAX_LISTED} more")
+
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--golden", default=GOLDEN_PATH)
+    parser.add_argument(
+        "--update-golden", action="store_true", help="overwrite the golden snapshot"
+    )
+    parser.add_argument("--report", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    entries = dictionary_entries()
+    start = time.perf_counter()
+    results, rule_stats = sweep(entries, args.workers)
+    elapsed = time.perf_counter() - start
+    median, outliers = find_outliers(entries, results)
+
+    golden_diff = None
+    if args.update_golden:
+        write_golden(args.golden, results)
+    elif os.path.exists(args.golden):
+        golden_diff = diff_golden(read_golden(args.golden), results)
+
+    report = build_report(
+        results, median, outliers, rule_stats, elapsed, args.workers, golden_diff
+    )
+    if args.update_golden:
+        report += f"\nGolden snapshot written to {args.golden}"
+    print(report)
+    if args.report:
+        with open(args.report, "w") as report_file:
+            report_file.write(report + "\n")
+
+    return 1 if golden_diff else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,10 @@
 import string
 import sys
+from collections import Counter
 from typing import Optional, List
 
 from syllabifier import cmuparser3
+from .phoneme_features import FEATURES
 from .phoneme_types import *
 from .syllable_types3 import (
     Cluster,
@@ -15,19 +17,27 @@ from .syllable_types3 import (
 CList = List[Cluster]
 SList = List[Syllable]
 
+cmu_dict = cmuparser3.CMUDictionary()
+
+REMOVE_DIGITS = str.maketrans("", "", string.digits)
+
+# number of onsets from which each Harley phonotactic rule in `onset_rules` moved consonants
+# into the previous coda
+rule_stats: Counter = Counter()
+
 # https://ipfs.io/ipfs/bafykbzacecizbpwbwfzejh2ynyfvxbyhuuyqcw54sfy3h3kaiqrrhxbggoatu?filename=%28The%20Language%20Library%29%20Heidi%20Harley%20-%20English%20Words_%20A%20Linguistic%20Introduction-Wiley-Blackwell%20%282006%29.pdf:w
 
 
 def parse_phonemes(phoneme_string: str) -> Phoneme:
     """creates a Vowel or Consonant from the single phoneme represented by `phoneme_string`"""
 
-    remove_digits = str.maketrans("", "", string.digits)
-    phoneme_string = phoneme_string.translate(remove_digits)
-    if phoneme_string in VOWELS:
+    phoneme_string = phoneme_string.translate(REMOVE_DIGITS)
+    features = FEATURES.get(phoneme_string)
+    if features is None:
+        raise ValueError(f"Don't recognize phoneme {phoneme_string}")
+    if features.is_vowel:
         return Vowel(phoneme_string)
-    elif phoneme_string in CONSONANTS:
-        return Consonant(phoneme_string)
-    raise ValueError(f"Don't recognize phoneme {phoneme_string}")
+    return Consonant(phoneme_string)
 
 
 def cluster_phonemes(clusters: CList, next_phoneme: Phoneme) -> CList:
@@ -141,6 +151,55 @@ def generate_syllables(phoneme_str: str):
     return check_last_syllable(syllables)
 
 
+def count_syllables(phoneme_str: str) -> int:
+    """
+    Counts the syllables in `phoneme_str` without building any Cluster or Syllable objects.
+
+    Vowels never cluster, and every vowel becomes the nucleus of exactly one syllable, so the
+    syllable count is the number of vowel phonemes. This agrees with
+    `len(generate_syllables(...))` for every pronunciation `generate_syllables` can syllabify.
+
+    Raises ValueError for an unknown phoneme, as `generate_syllables` does, and also ValueError
+    for a pronunciation without a vowel (e.g. 'F S'), where `generate_syllables` instead fails
+    with IndexError.
+    """
+
+    count = 0
+    for ph in phoneme_str.split():
+        ph = ph.translate(REMOVE_DIGITS)
+        features = FEATURES.get(ph)
+        if features is None:
+            raise ValueError(f"Don't recognize phoneme {ph}")
+        if features.is_vowel:
+            count += 1
+
+    if not count:
+        raise ValueError(f"No nucleus in '{phoneme_str}'")
+    return count
+
+
+def find_phonemes(candidate: str, dictionary: cmuparser3.CMUDictionary) -> Optional[str]:
+    """first pronunciation of `candidate` in `dictionary`, reporting words that aren't in it"""
+    phoneme_str = dictionary.get_first(candidate)
+    if not phoneme_str:
+        print("***" + candidate + " not in CMU dictionary, sorry, please try again...")
+    return phoneme_str
+
+
+def generate(candidate: str) -> Optional[SList]:
+    phoneme_str = find_phonemes(candidate, cmu_dict)
+    if phoneme_str:
+        return generate_syllables(phoneme_str)
+    return None
+
+
+def num_syllables(candidate: str) -> Optional[int]:
+    phoneme_str = find_phonemes(candidate, cmu_dict)
+    if phoneme_str:
+        return count_syllables(phoneme_str)
+    return None
+
+
 def onset_rules(onset: Cluster):
     """
     Given a proposed onset, checks whether any of the consonants are actually
@@ -149,30 +208,34 @@ def onset_rules(onset: Cluster):
 
     # parts of the proposed onset that should really be part of the previous coda instead
     coda = Cluster()
+    # rules that moved at least one consonant out of this onset
+    fired = set()
 
-    def move_n_to_coda(n: int = 1) -> None:
+    def move_n_to_coda(rule: str, n: int = 1) -> None:
         """
         Move the first `n` (default 1) consonants from the proposed onset into the coda instead
         """
         nonlocal onset, coda
+        if n:
+            fired.add(rule)
         to_move = onset.phoneme_list[:n]
         onset.phoneme_list = onset.phoneme_list[n:]
         coda.phoneme_list.extend(to_move)
 
-    def split_on(phoneme: str) -> None:
+    def split_on(rule: str, phoneme: str) -> None:
         """
         Find `phoneme` and move it and previous to the coda, out of the onset
         """
         nonlocal onset
-        move_n_to_coda(onset.find_first(phoneme) + 1)
+        move_n_to_coda(rule, onset.find_first(phoneme) + 1)
 
-    def split_before(phoneme: str) -> None:
+    def split_before(rule: str, phoneme: str) -> None:
         """
         Find `phoneme` and move anything before it to the coda, out of the onset.
         `phoneme` stays in the onset.
         """
         nonlocal onset
-        move_n_to_coda(onset.find_first(phoneme))
+        move_n_to_coda(rule, onset.find_first(phoneme))
 
     # Harley Phonotactic Rule 3: The velar nasal /NG/ never occurs in the onset of
     # a syllable.
@@ -180,14 +243,14 @@ def onset_rules(onset: Cluster):
     # must belong to the previous coda instead.
     # Test case: ringing
     if NG in onset:
-        split_on(NG)
+        split_on("rule_3", NG)
 
     # Harley Phonotactic Rule 4: The glottal fricative /HH/ never occurs in the coda
     # of a syllable.
     # -> if /HH/ occurs, it must be in the onset, so any unhandled consonants
     # before it must be in the previous coda
     if HH in onset:
-        split_before(HH)
+        split_before("rule_4", HH)
 
     # Harley Phonotactic Rule 5: The affricates /CH/ and /JH/, and the glottal
     # fricative /HH/ do not occur in complex onsets.
@@ -196,14 +259,14 @@ def onset_rules(onset: Cluster):
     if onset.is_complex:
         for ph in AFFRICATES | {HH}:
             if ph in onset.phoneme_list:
-                split_on(ph)
+                split_on("rule_5", ph)
 
     # Harley Phonotactic Rule 6: The first consonant in a two-consonant onset
     # must be an obstruent.
     # -> if the first consonant IS NOT an obstruent, it must belong to the
     # coda instead of to the onset
     if onset.is_complex and not onset.first.is_obstruent:
-        split_on(onset.first)
+        split_on("rule_6", onset.first)
 
     # Harley Phonotactic Rule 7: The second consonant in a two-consonant onset must
     # not be a voiced obstruent.
@@ -211,7 +274,7 @@ def onset_rules(onset: Cluster):
     # must belong to the previous coda
     # Test case: 'amused': [/Z/, /D/] are part of the coda
     if onset.is_complex and onset.second.is_voiced_obstruent:
-        split_on(onset.second)
+        split_on("rule_7", onset.second)
 
     # Harley Phonotactic Rule 8: If the first consonant of a two-consonant onset
     # is not an /S/, the second consonant must be a liquid or a glide (i.e., it must
@@ -220,6 +283,7 @@ def onset_rules(onset: Cluster):
     # approximate, then both the first and second consonants must belong to the previous
     # coda
     if onset.is_complex and onset.first != S and onset.second.is_approximate:
-        split_on(onset.second)
+        split_on("rule_8", onset.second)
 
+    rule_stats.update(fired)
     return coda, onset
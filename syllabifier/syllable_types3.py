@@ -5,6 +5,7 @@ Data types for syllabification
 from typing import Optional, List, Type
 
 
+from .phoneme_features import FEATURES
 from .phoneme_types import *
 
 
@@ -14,15 +15,15 @@ class Phoneme:
 
     @property
     def is_approximate(self):
-        return self.phoneme in APPROXIMANTS
+        return FEATURES[self.phoneme].is_approximant
 
     @property
     def is_obstruent(self):
-        return self.phoneme in OBSTRUENTS
+        return FEATURES[self.phoneme].is_obstruent
 
     @property
     def is_voiced_obstruent(self):
-        return self.phoneme in VOICED_OBSTRUENTS
+        return FEATURES[self.phoneme].is_voiced_obstruent
 
     def __eq__(self, other):
         if type(other) == str:
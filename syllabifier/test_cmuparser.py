@@ -1,6 +1,18 @@
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
+
+from . import cmuparser3
 from .cmuparser3 import *
 
+LATIN_1_DICT = b""";;; Fran\xe7ais
+AARONSON  EH1 R AH0 N S AH0 N
+CAF\xc9  K AE0 F EY1
+ZZYZX  Z IH1 Z IH0 K S
+ABC  EY1 B\x85 X
+"""
+
 
 class TestDictionary(unittest.TestCase):
     cmu_dict = CMUDictionary()
@@ -14,5 +26,95 @@ class TestDictionary(unittest.TestCase):
         self.assertEqual(len(self.cmu_dict["LAWFULLY"]), 1)
 
 
+class TestVersions(unittest.TestCase):
+    cmu_dict = CMUDictionary()
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "cmudict-latin-1")
+        with open(self.path, "wb") as dict_file:
+            dict_file.write(LATIN_1_DICT)
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        self.cache_dir_patch = patch.object(cmuparser3, "CACHE_DIR", self.cache_dir)
+        self.cache_dir_patch.start()
+        register_version("latin-1-test", "latin-1", self.path)
+
+    def tearDown(self):
+        unload_version("latin-1-test")
+        VERSIONS.pop("latin-1-test")
+        self.cache_dir_patch.stop()
+        self.tmp_dir.cleanup()
+
+    def test_decodes_with_registered_encoding(self):
+        other = CMUDictionary("latin-1-test")
+        self.assertEqual(other.get_first("CAF\xc9"), "K AE0 F EY1")
+
+    def test_only_newlines_split_lines(self):
+        other = CMUDictionary("latin-1-test")
+        self.assertEqual(other.get_first("ABC"), "EY1 B\x85 X")
+
+    def test_versions_share_phonemes(self):
+        other = CMUDictionary("latin-1-test")
+        self.assertIs(other["AARONSON"][0], self.cmu_dict["AARONSON"][0])
+        self.assertIsNone(other.get("LAWFULLY"))
+
+    def test_unloading_releases_phonemes(self):
+        CMUDictionary("latin-1-test")
+        self.assertIn("Z IH1 Z IH0 K S", PHONEME_TABLE)
+        unload_version("latin-1-test")
+        self.assertNotIn("Z IH1 Z IH0 K S", PHONEME_TABLE)
+        self.assertIs(
+            PHONEME_TABLE["EH1 R AH0 N S AH0 N"], self.cmu_dict["AARONSON"][0]
+        )
+
+    def test_compiled_cache_is_reused(self):
+        first = CMUDictionary("latin-1-test").get("AARONSON")
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(cache_path(self.path))])
+        self.assertFalse(os.path.exists(self.path + ".pickle"))
+        with patch.object(
+            cmuparser3, "parse_dictionary", wraps=cmuparser3.parse_dictionary
+        ) as parse:
+            register_version("latin-1-test", "latin-1", self.path)
+            self.assertEqual(CMUDictionary("latin-1-test").get("AARONSON"), first)
+            parse.assert_not_called()
+
+    def test_compiled_cache_is_rebuilt(self):
+        CMUDictionary("latin-1-test")
+        with patch.object(
+            cmuparser3, "parse_dictionary", wraps=cmuparser3.parse_dictionary
+        ) as parse:
+            stat = os.stat(self.path)
+            os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            register_version("latin-1-test", "latin-1", self.path)
+            CMUDictionary("latin-1-test")
+            self.assertEqual(parse.call_count, 1)
+
+            register_version("latin-1-test", "cp1252", self.path)
+            self.assertEqual(CMUDictionary("latin-1-test").get_first("CAF\xc9"), "K AE0 F EY1")
+            self.assertEqual(parse.call_count, 2)
+
+    def test_compiled_cache_tracks_parser_version(self):
+        CMUDictionary("latin-1-test")
+        with patch.object(
+            cmuparser3, "parse_dictionary", wraps=cmuparser3.parse_dictionary
+        ) as parse, patch.object(cmuparser3, "CACHE_VERSION", CACHE_VERSION + 1):
+            register_version("latin-1-test", "latin-1", self.path)
+            CMUDictionary("latin-1-test")
+            parse.assert_called_once()
+
+    def test_untrusted_cache_is_ignored(self):
+        CMUDictionary("latin-1-test")
+        os.chmod(cache_path(self.path), 0o666)
+        with patch.object(
+            cmuparser3, "parse_dictionary", wraps=cmuparser3.parse_dictionary
+        ) as parse:
+            register_version("latin-1-test", "latin-1", self.path)
+            CMUDictionary("latin-1-test")
+            parse.assert_called_once()
+
+    def test_unknown_version(self):
+        self.assertRaises(ValueError, CMUDictionary, "cmudict.9.9")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+
+from . import gen_phoneme_features
+from .phoneme_features import FEATURES
+from .phoneme_types import *
+
+
+class TestPhonemeFeatures(unittest.TestCase):
+    def test_generated_table_is_current(self):
+        with open(gen_phoneme_features.OUTPUT_PATH, "r") as features_file:
+            self.assertEqual(
+                features_file.read(),
+                gen_phoneme_features.generate(),
+                "phoneme_features.py is stale, re-run gen_phoneme_features",
+            )
+
+    def test_every_phoneme_has_features(self):
+        self.assertEqual(set(FEATURES), set(VOWELS) | set(CONSONANTS))
+        for ph in VOWELS:
+            with self.subTest(phoneme=ph):
+                self.assertTrue(FEATURES[ph].is_vowel)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from . import sweep, syllable3
+
+
+class TestSweep(unittest.TestCase):
+    golden = sweep.read_golden(sweep.GOLDEN_PATH)
+
+    def test_sample_matches_golden(self):
+        entries = sweep.dictionary_entries()[::500]
+        results, _ = sweep.sweep(entries, workers=1)
+        for word, alt, outcome, _ in results:
+            with self.subTest(word=word, alt=alt):
+                self.assertEqual(outcome, self.golden[(word, alt)])
+
+    def test_failures_are_recorded(self):
+        results, _ = sweep.sweep([("FS", 0, "F S")], workers=1)
+        self.assertTrue(results[0][2].startswith("!IndexError"))
+
+    def test_rule_stats_are_collected(self):
+        _, rule_stats = sweep.sweep([("RINGING", 0, "R IH1 NG IH0 NG")], workers=1)
+        self.assertEqual(rule_stats["rule_3"], 2)
+
+    def test_rule_stats_only_count_moves(self):
+        # /HH/ already starts the onset of 'behave', so rule 4 moves nothing
+        _, rule_stats = sweep.sweep([("BEHAVE", 0, "B IH0 HH EY1 V")], workers=1)
+        self.assertEqual(rule_stats["rule_4"], 0)
+
+    def test_rule_stats_keep_callers_counts(self):
+        syllable3.rule_stats["rule_3"] += 1000
+        try:
+            before = syllable3.rule_stats["rule_3"]
+            _, rule_stats = sweep.sweep([("RINGING", 0, "R IH1 NG IH0 NG")], workers=1)
+            self.assertEqual(rule_stats["rule_3"], 2)
+            self.assertEqual(syllable3.rule_stats["rule_3"], before + 2)
+        finally:
+            syllable3.rule_stats["rule_3"] -= 1000
+
+    def test_noisy_timings_are_not_outliers(self):
+        entries = [("LAWFUL", 0, "L AO1 F AH0 L")] * 3
+        results = [(word, alt, "", 1e-5) for word, alt, _ in entries]
+        results[0] = ("LAWFUL", 0, "", 10.0)
+        _, outliers = sweep.find_outliers(entries, results)
+        self.assertEqual(outliers, [])
+
+    def test_diff_reports_changes(self):
+        results = [("LAWFUL", 0, "<o:L|n:AO|c:F> <o:L|n:AH|c:None>", 0.0)]
+        diff = sweep.diff_golden({("LAWFUL", 0): "<o:L|n:AO|c:None>"}, results)
+        self.assertEqual(len(diff), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
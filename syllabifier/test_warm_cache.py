@@ -0,0 +1,83 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from . import cmuparser3, syllable3
+from .warm_cache import WarmCache, parse_frequency_line, read_frequency_list
+
+
+class TestWarmCache(unittest.TestCase):
+    def test_frequency_list_sorted_by_count(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "words.csv")
+            with open(path, "w") as freq_file:
+                freq_file.write("lawful,3\nthe,120\n\nhello,45\n")
+            self.assertEqual(read_frequency_list(path), ["the", "hello", "lawful"])
+
+    def test_frequency_list_count_first(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "words.txt")
+            with open(path, "w") as freq_file:
+                freq_file.write("      3 lawful\n    120 the\n     45 hello\n")
+            self.assertEqual(read_frequency_list(path), ["the", "hello", "lawful"])
+
+    def test_frequency_list_skips_malformed_lines(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "words.csv")
+            with open(path, "w") as freq_file:
+                freq_file.write("the,120\nice cream,4\nhello,many\n,7\nlawful,3\n")
+            with redirect_stdout(io.StringIO()) as out:
+                words = read_frequency_list(path)
+            self.assertEqual(words, ["the", "ice cream", "lawful"])
+            self.assertIn("skipped 2", out.getvalue())
+
+    def test_parse_frequency_line(self):
+        self.assertEqual(parse_frequency_line("ice cream 4\n"), ("ice cream", 4.0))
+        self.assertEqual(parse_frequency_line("  12 the\n"), ("the", 12.0))
+        self.assertEqual(parse_frequency_line("the\t0.5\n"), ("the", 0.5))
+        self.assertEqual(parse_frequency_line("hello\n"), ("hello", 0.0))
+        self.assertIsNone(parse_frequency_line("the big cheese\n"))
+        self.assertIsNone(parse_frequency_line("120\n"))
+
+    def test_pins_top_n(self):
+        cache = WarmCache(["the", "xqzzy", "of", "and", "lawful"], top_n=3)
+        self.assertEqual(cache.pinned, 3)
+        self.assertEqual(cache.stats()["pinned"], 3)
+
+    def test_hit_rate(self):
+        cache = WarmCache(["the", "hello"])
+        self.assertEqual(cache.num_syllables("the"), 1)
+        self.assertEqual(cache.num_syllables("Hello"), 2)
+        self.assertEqual(cache.num_syllables("linguistics"), 3)
+        self.assertEqual(cache.pinned_hits, 2)
+        self.assertEqual(cache.lookups, 3)
+        self.assertAlmostEqual(cache.hit_rate, 2 / 3)
+
+    def test_pinned_matches_generate(self):
+        cache = WarmCache(["therapeutic"])
+        self.assertEqual(
+            [str(syl) for syl in cache.generate("therapeutic")],
+            [str(syl) for syl in syllable3.generate("therapeutic")],
+        )
+
+    def test_misses_use_given_dictionary(self):
+        other = cmuparser3.CMUDictionary()
+        cache = WarmCache(["the"], cmu_dict=other)
+        with patch.object(other, "get_first", return_value="K AE1 T") as get_first:
+            self.assertEqual(cache.num_syllables("zzyzx"), 1)
+            get_first.assert_called_once_with("zzyzx")
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertIsNone(cache.generate("zzyzx"))
+        self.assertIn("not in CMU dictionary", out.getvalue())
+
+    def test_budget_stops_warmup(self):
+        cache = WarmCache(["the", "hello"], budget=-1)
+        self.assertEqual(cache.pinned, 0)
+        self.assertTrue(cache.budget_exhausted)
+
+
+if __name__ == "__main__":
+    unittest.main()
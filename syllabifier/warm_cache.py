@@ -0,0 +1,168 @@
+"""
+Pre-syllabifies the most frequent words at startup, so lookups of common words never pay for
+`generate_syllables`. Everything else goes through the normal `syllable3` path.
+
+    cache = WarmCache.from_file("top_words.txt", top_n=5000, budget=0.5)
+    cache.generate("the")
+"""
+
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from . import cmuparser3, syllable3
+from .syllable3 import SList
+
+DEFAULT_TOP_N = 10000
+DEFAULT_BUDGET = 1.0
+
+COUNT_PATTERN = re.compile(r"\d+(\.\d+)?$")
+DELIMITER_PATTERN = re.compile(r"[,\t]")
+
+
+def parse_frequency_line(line: str) -> Optional[Tuple[str, float]]:
+    """
+    Parses one line of a frequency list into (word, count), or returns None if it doesn't
+    parse. The count may follow the word or, as `sort | uniq -c` writes it, precede it, and is
+    separated by a comma, a tab or spaces. A line holding just a word has a count of 0.
+    """
+    line = line.strip()
+    if DELIMITER_PATTERN.search(line):
+        fields = [field.strip() for field in DELIMITER_PATTERN.split(line)]
+        if len(fields) != 2:
+            return None
+    else:
+        fields = line.split()
+    if not fields or not all(fields):
+        return None
+
+    if len(fields) == 1:
+        if COUNT_PATTERN.match(fields[0]):
+            return None
+        return fields[0], 0.0
+    if COUNT_PATTERN.match(fields[-1]):
+        return " ".join(fields[:-1]), float(fields[-1])
+    if COUNT_PATTERN.match(fields[0]):
+        return " ".join(fields[1:]), float(fields[0])
+    return None
+
+
+def read_frequency_list(path: str) -> List[str]:
+    """
+    Reads a frequency list with one word per line and an optional count (see
+    `parse_frequency_line`). Words are returned most frequent first; without counts, the file
+    order is taken to be the frequency order. Lines that don't parse are skipped and reported.
+    """
+    entries = []
+    skipped = []
+    with open(path, "r") as freq_file:
+        for line_number, line in enumerate(freq_file, start=1):
+            if not line.strip():
+                continue
+            entry = parse_frequency_line(line)
+            if entry is None:
+                skipped.append(line_number)
+                continue
+            entries.append(entry)
+    if skipped:
+        print(f"***skipped {len(skipped)} unreadable line(s) in {path}: {skipped[:10]}")
+    entries.sort(key=lambda entry: entry[1], reverse=True)
+    return [word for word, _ in entries]
+
+
+class WarmCache:
+    """
+    Holds the syllabifications of the hottest words, pinned for the life of the process.
+    Pinned syllable lists are shared between callers and must not be modified.
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str],
+        top_n: int = DEFAULT_TOP_N,
+        budget: float = DEFAULT_BUDGET,
+        cmu_dict: Optional[cmuparser3.CMUDictionary] = None,
+    ):
+        self.cmu_dict = cmu_dict or syllable3.cmu_dict
+        self._pinned: Dict[str, SList] = {}
+        self.lookups = 0
+        self.pinned_hits = 0
+        self.warmup_seconds = 0.0
+        self.budget_exhausted = False
+        self._warm(words, top_n, budget)
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "WarmCache":
+        return cls(read_frequency_list(path), **kwargs)
+
+    def _warm(self, words: Iterable[str], top_n: int, budget: float) -> None:
+        """pins up to `top_n` of `words` that are in the dictionary, stopping after `budget` seconds"""
+        start = time.perf_counter()
+        for word in words:
+            if len(self._pinned) >= top_n:
+                break
+            if time.perf_counter() - start > budget:
+                self.budget_exhausted = True
+                break
+            key = word.upper()
+            if key in self._pinned:
+                continue
+            phoneme_str = self.cmu_dict.get_first(key)
+            if not phoneme_str:
+                continue
+            try:
+                self._pinned[key] = syllable3.generate_syllables(phoneme_str)
+            except (AttributeError, IndexError, ValueError):
+                continue
+        self.warmup_seconds = time.perf_counter() - start
+
+    def _lookup(self, candidate: str) -> Optional[SList]:
+        self.lookups += 1
+        syllables = self._pinned.get(candidate.upper())
+        if syllables is not None:
+            self.pinned_hits += 1
+        return syllables
+
+    def generate(self, candidate: str) -> Optional[SList]:
+        syllables = self._lookup(candidate)
+        if syllables is not None:
+            return syllables
+        if self.cmu_dict is syllable3.cmu_dict:
+            return syllable3.generate(candidate)
+        phoneme_str = syllable3.find_phonemes(candidate, self.cmu_dict)
+        if phoneme_str:
+            return syllable3.generate_syllables(phoneme_str)
+        return None
+
+    def num_syllables(self, candidate: str) -> Optional[int]:
+        syllables = self._lookup(candidate)
+        if syllables is not None:
+            return len(syllables)
+        if self.cmu_dict is syllable3.cmu_dict:
+            return syllable3.num_syllables(candidate)
+        phoneme_str = syllable3.find_phonemes(candidate, self.cmu_dict)
+        if phoneme_str:
+            return syllable3.count_syllables(phoneme_str)
+        return None
+
+    @property
+    def pinned(self) -> int:
+        return len(self._pinned)
+
+    @property
+    def hit_rate(self) -> float:
+        """share of all lookups that were served from the pinned words"""
+        if not self.lookups:
+            return 0.0
+        return self.pinned_hits / self.lookups
+
+    def stats(self) -> Dict[str, Union[int, float, bool]]:
+        return {
+            "pinned": self.pinned,
+            "warmup_seconds": self.warmup_seconds,
+            "budget_exhausted": self.budget_exhausted,
+            "lookups": self.lookups,
+            "pinned_hits": self.pinned_hits,
+            "misses": self.lookups - self.pinned_hits,
+            "hit_rate": self.hit_rate,
+        }